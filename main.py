@@ -15,10 +15,12 @@
 """
 
 # region Imports
+import asyncio
 from fastapi import FastAPI
 from fastapi.responses import HTMLResponse, JSONResponse
 from pydantic import ValidationError
 from openAPI_IDC.routes.CreateIncidentRoute import router as CreateIncidentRoute
+from openAPI_IDC.coreFunctions.DatabaseOparations.mongo_client import ensure_indexes, get_client
 import uvicorn
 from utils.logger.loggers import get_logger
 # endregion
@@ -29,6 +31,13 @@ logger_INC1A01 = get_logger('INC1A01')
 
 # region App Initialization
 app = FastAPI()
+
+@app.on_event("startup")
+async def startup_db():
+    if not ensure_indexes():
+        logger_INC1A01.error(
+            "MongoDB index creation failed at startup; hinted queries will fail until the indexes exist."
+        )
 # endregion
 
 # region Exception Handlers
@@ -65,6 +74,18 @@ async def read_root():
     """
 # endregion
 
+# region Health Route
+@app.get("/health")
+async def health_check():
+    try:
+        # Run the blocking ping in a worker thread so an unreachable database
+        # cannot stall the event loop for the whole server-selection timeout
+        await asyncio.to_thread(lambda: get_client().admin.command('ping'))
+        return {"status": "ok"}
+    except Exception as e:
+        return JSONResponse(status_code=503, content={"status": "unavailable", "detail": str(e)})
+# endregion
+
 # region Route Inclusions
 app.include_router(CreateIncidentRoute)
 # endregion
@@ -19,10 +19,10 @@
 """
 
 # region Imports
-from pymongo import MongoClient
 from typing import List, Dict
-from pymongo.errors import DuplicateKeyError
-from openAPI_IDC.coreFunctions.ConfigManager import get_config
+from pymongo import WriteConcern
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+from openAPI_IDC.coreFunctions.DatabaseOparations.mongo_client import get_client, get_db
 from utils.logger.loggers import get_logger
 # endregion
 
@@ -36,42 +36,42 @@ def create_incident_data_manipulation(customer_link_accounts_details: List[Dict]
         Inserts a new incident into the MongoDB 'Incidents' collection and, if applicable,
         updates related incidents and case documents with cross-account references.
     """
-    client = None
     inserted_id = None
 
     # region MongoDB Connection
     try:
-        db_config = get_config("database", "DATABASE")
-        client = MongoClient(db_config.get("mongo_uri").strip())
-        client.admin.command('ping')
-        db = client[db_config.get("db_name").strip()]
+        db = get_db()
     except Exception as e:
         logger_INC1A01.info(f"Connection error: {e}")
         return {"success": False, "error": "Mongo DB connection error"}
     # endregion
 
-    else:
-        # region Collections Initialization
-        IncidentCollection = db["Incidents"]
-        CaseCollection = db["Case_details"]
-        # endregion
+    # region Collections Initialization
+    # w=1 without journal ack keeps the fsync wait off the hot insert path
+    IncidentCollection = db.get_collection("Incidents", write_concern=WriteConcern(w=1, j=False))
+    CaseCollection = db["Case_details"]
+    # endregion
 
+    # A single session pins one pooled socket for the insert and all follow-up updates
+    with get_client().start_session() as session:
+        # region Incident Insertion
         try:
-            # region Incident Insertion
-            try:
-                IncidentCollection.create_index("Incident_Id", unique=True)
-                root_result = IncidentCollection.insert_one(new_incident)
-                inserted_id = root_result.inserted_id
-                logger_INC1A01.info(f"Incident inserted successfully with ID: {new_incident['Incident_Id']}")
-            except DuplicateKeyError as dup_err:
-                logger_INC1A01.error(f"Duplicate Incident_Id: {new_incident['Incident_Id']}")
-                logger_INC1A01.error(f"Original incident: {new_incident}")
-                return {"success": False, "error": dup_err}
-            except Exception as e:
-                logger_INC1A01.error(f"Insert error: {e}")
-                return {"success": False, "error": f"Incident insertion failed {new_incident['Incident_Id']}"}
-            # endregion
+            # Schema was already validated by Pydantic, so skip server-side validation
+            root_result = IncidentCollection.insert_one(
+                new_incident, bypass_document_validation=True, session=session
+            )
+            inserted_id = root_result.inserted_id
+            logger_INC1A01.info(f"Incident inserted successfully with ID: {new_incident['Incident_Id']}")
+        except DuplicateKeyError as dup_err:
+            logger_INC1A01.error(f"Duplicate Incident_Id: {new_incident['Incident_Id']}")
+            logger_INC1A01.error(f"Original incident: {new_incident}")
+            return {"success": False, "error": dup_err}
+        except Exception as e:
+            logger_INC1A01.error(f"Insert error: {e}")
+            return {"success": False, "error": f"Incident insertion failed {new_incident['Incident_Id']}"}
+        # endregion
 
+        try:
             # region Linked Account Checks
             if not customer_link_accounts_details or len(customer_link_accounts_details) < 2:
                 logger_INC1A01.info("No linked accounts to process.")
@@ -95,7 +95,8 @@ def create_incident_data_manipulation(customer_link_accounts_details: List[Dict]
             for incident_id in incident_id_list:
                 result = IncidentCollection.update_one(
                     {"Incident_Id": incident_id},
-                    {"$addToSet": {"Account_Cross_Details": cross_detail_entry}}
+                    {"$addToSet": {"Account_Cross_Details": cross_detail_entry}},
+                    session=session
                 )
                 if result.matched_count == 0:
                     raise Exception(f"Incident {new_incident['Incident_Id']} not found during update")
@@ -105,7 +106,8 @@ def create_incident_data_manipulation(customer_link_accounts_details: List[Dict]
             for case_id in case_id_list:
                 result = CaseCollection.update_one(
                     {"case_id": case_id},
-                    {"$addToSet": {"Account_Cross_Details": cross_detail_entry}}
+                    {"$addToSet": {"Account_Cross_Details": cross_detail_entry}},
+                    session=session
                 )
                 if result.matched_count == 0:
                     raise Exception(f"Case {case_id} not found during update")
@@ -119,16 +121,53 @@ def create_incident_data_manipulation(customer_link_accounts_details: List[Dict]
             logger_INC1A01.error(f"Manual rollback triggered due to: {e}")
             if inserted_id:
                 try:
-                    IncidentCollection.delete_one({"_id": inserted_id})
+                    IncidentCollection.delete_one({"_id": inserted_id}, session=session)
                     logger_INC1A01.warning(f"Rolled back inserted incident with ID: {inserted_id}")
                 except Exception as rollback_error:
                     logger_INC1A01.error(f"Rollback failed: {rollback_error}")
             return {"success": False, "error": str(e)}
         # endregion
+# endregion
 
-    # region Close Connection
-    finally:
-        if client:
-            client.close()
-    # endregion
+
+# region Bulk Insert Function
+def create_incidents_bulk_insert(new_incidents: List[Dict]):
+    """
+        Inserts many prepared incident documents into the 'Incidents' collection
+        with one unordered insert_many, so the whole batch costs a single round trip.
+
+        Args:
+            new_incidents (List[Dict]): Fully prepared incident documents.
+
+        Returns:
+            dict: {"success": bool, "errors": {batch_index: error}} where errors maps
+                  the position of each failed document within the batch to its error.
+    """
+    try:
+        db = get_db()
+    except Exception as e:
+        logger_INC1A01.info(f"Connection error: {e}")
+        return {"success": False, "error": "Mongo DB connection error",
+                "errors": {index: "Mongo DB connection error" for index in range(len(new_incidents))}}
+
+    IncidentCollection = db.get_collection("Incidents", write_concern=WriteConcern(w=1, j=False))
+
+    try:
+        IncidentCollection.insert_many(new_incidents, ordered=False, bypass_document_validation=True)
+        logger_INC1A01.info(f"Inserted {len(new_incidents)} incident(s) in one batch.")
+        return {"success": True, "errors": {}}
+
+    except BulkWriteError as bulk_err:
+        # Unordered writes keep going past failures; map each one back to its document
+        write_errors = {
+            write_error["index"]: write_error.get("errmsg", "write error")
+            for write_error in bulk_err.details.get("writeErrors", [])
+        }
+        logger_INC1A01.error(f"Bulk insert completed with {len(write_errors)} failure(s): {write_errors}")
+        return {"success": False, "errors": write_errors}
+
+    except Exception as e:
+        logger_INC1A01.error(f"Bulk insert error: {e}")
+        return {"success": False, "error": str(e),
+                "errors": {index: str(e) for index in range(len(new_incidents))}}
 # endregion
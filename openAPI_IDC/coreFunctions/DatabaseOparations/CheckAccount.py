@@ -16,8 +16,9 @@
 """
 
 # region Imports
-from pymongo import MongoClient
-from openAPI_IDC.coreFunctions.ConfigManager import get_config, initialize_hash_maps
+import logging
+from openAPI_IDC.coreFunctions.ConfigManager import initialize_hash_maps
+from openAPI_IDC.coreFunctions.DatabaseOparations.mongo_client import ensure_indexes, get_db
 from openAPI_IDC.coreFunctions.F1_Filter.example_incident_dict import incident_dict
 from utils.logger.loggers import get_logger
 from datetime import datetime
@@ -28,7 +29,22 @@ logger_INC1A01 = get_logger('INC1A01')
 # endregion
 
 # region Global Variables
-customer_link_accounts_details = []
+# Statuses that mean a case is no longer open. The known mixed-case spellings
+# are kept because Case_details is written by an external system; the
+# normalize_case_statuses migration lowercases existing data but cannot
+# guarantee the casing of future writes.
+CLOSED_STATUSES = (
+    "close", "Close", "Case Close", "case close",
+    "write-off", "Write-Off",
+    "abandoned", "Abandoned",
+    "withdraw", "Withdraw"
+)
+
+# Compound index hints matching the indexes built in mongo_client.ensure_indexes.
+# aggregate() sends its hint verbatim into the command document, so it must be a
+# dict (or index name); only find()/count_documents() convert list-of-tuple hints.
+_HAS_OPEN_HINT = [("Account_Num", 1), ("case_current_status", 1)]
+_CUSTOMER_REF_HINT = {"customer_ref": 1, "case_current_status": 1}
 # endregion
 
 # region has_open_case_for_account
@@ -37,8 +53,9 @@ def has_open_case_for_account(incident_dict):
         Checks if there is at least one **open case** for the given Account_Num
         in the 'Case_details' collection.
 
-        A case is considered "open" if the case_current_status is NOT in
-        ["close", "write-off", "abandoned", "withdraw"], ignoring case sensitivity.
+        A case is considered "open" if the case_current_status is NOT one of
+        CLOSED_STATUSES, which covers the known mixed-case spellings so the
+        check stays a plain indexed \$nin.
 
         Args:
             incident_dict (dict): A dictionary that must contain the key 'Account_Num'.
@@ -48,85 +65,68 @@ def has_open_case_for_account(incident_dict):
             "False" -> if no open cases are found or if any error occurs.
         """
 
-    client = None
-    try:
-        # Load MongoDB configuration
-        db_config = get_config("database", "DATABASE")
-
-        # Connect to MongoDB
-        client = MongoClient(db_config.get("mongo_uri").strip())
-        client.admin.command('ping')  # Ensure MongoDB is reachable
-
-        # Get database and collection
-        db = client[db_config.get("db_name").strip()]
-
-    except Exception as err:
-        # Handle any errors that occur during connection setup
-        logger_INC1A01.info(f"Connection error: {err}")
+    # Short-circuit before touching the database when there is nothing to check
+    account_number = incident_dict.get("Account_Num")
+    if not account_number:
+        logger_INC1A01.warning("Account_Num missing from incident dict; skipping open-case check.")
         return "False"
 
-    else:
-        try:
-            collection = db["Case_details"]
-
-            # Define the query to check for open cases
-            query = {
-                "$expr": {
-                    "$and": [
-                        {"$eq": ["$Account_Num", incident_dict.get("Account_Num")]},
-                        {
-                            "$not": {
-                                "$in": [
-                                    {"$toLower": "$case_current_status"},
-                                    ["close", "write-off", "abandoned", "withdraw"]
-                                ]
-                            }
-                        }
-                    ]
-                }
-            }
+    try:
+        # Retries index creation if startup failed; a no-op once they exist
+        ensure_indexes()
 
-            # Check if any matching document exists
-            Open_acc = collection.find_one(query)
+        # Get the database from the shared pooled client
+        collection = get_db()["Case_details"]
 
-            logger_INC1A01.debug(Open_acc)
+        # Define the query to check for open cases
+        query = {
+            "Account_Num": account_number,
+            "case_current_status": {"$nin": list(CLOSED_STATUSES)}
+        }
 
-            if Open_acc:
-                logger_INC1A01.info("open cases found for relevant account")
-                return "True"
+        # Fetch at most the _id of a single matching open case
+        open_case = collection.find_one(query, projection={"_id": 1}, hint=_HAS_OPEN_HINT)
 
-            else:
-                logger_INC1A01.info("No open cases found for relevant account")
-                return "False"
+        logger_INC1A01.debug(open_case)
 
+        if open_case is not None:
+            logger_INC1A01.debug("open cases found for relevant account")
+            return "True"
 
-        except Exception as e:
-            logger_INC1A01.error(f"Error: {e}")
+        else:
+            logger_INC1A01.debug("No open cases found for relevant account")
             return "False"
 
-    finally:
-        # Close the MongoDB client connection
-        if client:
-            client.close()
+    except Exception as e:
+        logger_INC1A01.error(f"Error: {e}")
+        return "False"
 
 
 # endregion
 
 # region Link Accounts Function
 def link_accounts_from_open_accounts(incident_dict):
-    logger_INC1A01.info("Started linking accounts from open incidents and cases.")
-    customer_link_accounts_details.clear()
+    logger_INC1A01.debug("Started linking accounts from open incidents and cases.")
+
+    # Request-local so concurrent requests cannot corrupt each other's cross details
+    link_accounts_details = []
+
+    # Short-circuit before touching the database when there is no customer reference
+    customer_ref = incident_dict.get('Customer_Ref')
+    if not customer_ref:
+        logger_INC1A01.warning("Customer_Ref missing from incident dict; skipping account linking.")
+        return incident_dict
+
     try:
-        customer_ref = incident_dict['Customer_Ref']
-        logger_INC1A01.debug(f"Customer Ref: {customer_ref}")
+        logger_INC1A01.debug("Customer Ref: %s", customer_ref)
 
         root_account_details = get_root_account_details(incident_dict)
 
         open_accounts_caseDetails = get_same_customer_accounts_from_case_details(customer_ref)
         open_accounts_incidents = get_same_customer_accounts_from_Incidents(customer_ref)
 
-        logger_INC1A01.info(f"Found {len(open_accounts_caseDetails)} open case(s)")
-        logger_INC1A01.info(f"Found {len(open_accounts_incidents)} open incident(s)")
+        # Track already-linked account numbers for O(1) duplicate checks
+        seen_accounts = set()
 
         # Root Account
         entry = {
@@ -136,30 +136,49 @@ def link_accounts_from_open_accounts(incident_dict):
             "Account_Status": root_account_details.get("Incident_Status", ""),
             "OutstandingBalance": root_account_details.get("Arrears", 0)
         }
-        customer_link_accounts_details.append(entry)
+        link_accounts_details.append(entry)
+        seen_accounts.add(entry["Account_Num"])
 
         # Open Incidents
         for item in open_accounts_incidents:
-            customer_link_accounts_details.append({
+            account_num = item.get("Account_Num", "")
+            if account_num in seen_accounts:
+                continue
+            seen_accounts.add(account_num)
+            link_accounts_details.append({
                 "Incident_Id": item.get("Incident_Id", ""),
                 "Case_Id": "",
-                "Account_Num": item.get("Account_Num", ""),
+                "Account_Num": account_num,
                 "Account_Status": item.get("Incident_Status", ""),
                 "OutstandingBalance": item.get("Arrears", 0)
             })
 
         # Open Case Details
         for item in open_accounts_caseDetails:
-            customer_link_accounts_details.append({
+            account_num = item.get("Account_Num", "")
+            if account_num in seen_accounts:
+                continue
+            seen_accounts.add(account_num)
+            link_accounts_details.append({
                 "Incident_Id": "",
                 "Case_Id": item.get("case_id", ""),
-                "Account_Num": item.get("Account_Num", ""),
+                "Account_Num": account_num,
                 "Account_Status": item.get("case_current_status", ""),
                 "OutstandingBalance": item.get("bss_arrears_amount", 0)
             })
 
-        incident_dict["Account_Cross_Details"] = customer_link_accounts_details
-        logger_INC1A01.info(f"Linked accounts added to incident dictionary successfully: {incident_dict}")
+        incident_dict["Account_Cross_Details"] = link_accounts_details
+
+        # One summary line; the full dict is only formatted when DEBUG is on
+        logger_INC1A01.info(
+            "Linked %d account(s) from %d open case(s) and %d open incident(s) for customer_ref %s",
+            len(link_accounts_details),
+            len(open_accounts_caseDetails),
+            len(open_accounts_incidents),
+            customer_ref
+        )
+        if logger_INC1A01.isEnabledFor(logging.DEBUG):
+            logger_INC1A01.debug(f"Linked accounts added to incident dictionary successfully: {incident_dict}")
         return incident_dict
 
     except Exception as e:
@@ -182,49 +201,43 @@ def get_same_customer_accounts_from_case_details(customer_ref: str) -> list:
     Returns:
         list: List of dictionaries containing case details.
     """
-    logger_INC1A01.info(f"Fetching open cases for customer_ref: {customer_ref}")
-    client = None
+    logger_INC1A01.debug("Fetching open cases for customer_ref: %s", customer_ref)
     try:
-        db_config = get_config("database", "DATABASE")
-        client = MongoClient(db_config.get("mongo_uri").strip())
-        client.admin.command('ping')
-        db = client[db_config.get("db_name").strip()]
+        # Retries index creation if startup failed; a no-op once they exist
+        ensure_indexes()
 
-        collection = db["Case_details"]
+        collection = get_db()["Case_details"]
 
         query = {
-            "$expr": {
-                "$and": [
-                    {"$eq": ["$customer_ref", customer_ref]},
-                    {
-                        "$not": {
-                            "$in": [
-                                {"$toLower": "$case_current_status"},
-                                ["close", "write-off", "abandoned", "withdraw"]
-                            ]
-                        }
-                    }
-                ]
-            }
+            "customer_ref": customer_ref,
+            "case_current_status": {"$nin": list(CLOSED_STATUSES)}
         }
 
-        results = list(collection.find(query, {
-            "case_id": 1,
-            "Account_Num": 1,
-            "case_current_status": 1,
-            "bss_arrears_amount": 1,
-            "_id": 0
-        }))
-        logger_INC1A01.debug(f"Query returned {results} case records.")
+        # Group on the server so each distinct Account_Num comes back exactly once
+        pipeline = [
+            {"$match": query},
+            {"$group": {
+                "_id": "$Account_Num",
+                "case_id": {"$first": "$case_id"},
+                "case_current_status": {"$first": "$case_current_status"},
+                "bss_arrears_amount": {"$first": "$bss_arrears_amount"}
+            }},
+            {"$project": {
+                "_id": 0,
+                "Account_Num": "$_id",
+                "case_id": 1,
+                "case_current_status": 1,
+                "bss_arrears_amount": 1
+            }}
+        ]
+
+        results = list(collection.aggregate(pipeline, hint=_CUSTOMER_REF_HINT))
+        logger_INC1A01.debug("Query returned %s case records.", results)
         return results
 
     except Exception as e:
         logger_INC1A01.error(f"Error retrieving case details for customer_ref {customer_ref}: {e}")
         return []
-
-    finally:
-        if client:
-            client.close()
 # endregion
 
 
@@ -239,13 +252,9 @@ def get_same_customer_accounts_from_Incidents(customer_ref: str) -> list:
     Returns:
         list: List of dictionaries containing incident details.
     """
-    logger_INC1A01.info(f"Fetching open incidents for customer_ref: {customer_ref}")
-    client = None
+    logger_INC1A01.debug("Fetching open incidents for customer_ref: %s", customer_ref)
     try:
-        db_config = get_config("database", "DATABASE")
-        client = MongoClient(db_config.get("mongo_uri").strip())
-        client.admin.command('ping')
-        db = client[db_config.get("db_name").strip()]
+        db = get_db()
 
         collection = db["Incidents"]
 
@@ -274,17 +283,13 @@ def get_same_customer_accounts_from_Incidents(customer_ref: str) -> list:
             "Arrears": 1,
             "_id": 0
         }))
-        logger_INC1A01.debug(f"Query returned {results} incident records.")
+        logger_INC1A01.debug("Query returned %s incident records.", results)
         return results
 
     except Exception as e:
         logger_INC1A01.error(f"Error retrieving incident details for customer_ref {customer_ref}: {e}")
         return []
 
-    finally:
-        if client:
-            client.close()
-
 # endregion
 
 
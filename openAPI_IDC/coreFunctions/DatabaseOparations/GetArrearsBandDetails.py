@@ -19,8 +19,7 @@
 # region Imports
 from pymongo import DESCENDING
 from datetime import datetime, timezone
-from pymongo import MongoClient
-from openAPI_IDC.coreFunctions.ConfigManager import get_config
+from openAPI_IDC.coreFunctions.DatabaseOparations.mongo_client import get_db
 from utils.logger.loggers import get_logger
 # endregion
 
@@ -42,64 +41,43 @@ def get_arrears_bands_details():
               Returns an empty dict if no active data is found.
               Returns False if database connection fails.
     """
-    client = None
     try:
-        # Get database configuration from the config hash map
-        db_config = get_config("database", "DATABASE")
-
-        # Connect to MongoDB using configured URI
-        client = MongoClient(db_config.get("mongo_uri").strip())
-
-        # Ping to verify the connection is alive
-        client.admin.command('ping')
-
-        # Select the configured database
-        db = client[db_config.get("db_name").strip()]
-
-    except Exception as e:
-        # Log connection issues
-        logger_INC1A01.error(f"Connection error: {e}")
-        return {"success": False, "error": "Mongo DB connection error"}
-
-    else:
-        try:
-            # Access the 'Arrears_bands' collection
-            collection = db["Arrears_bands"]
-
-            # Get the current UTC datetime
-            current_date = datetime.now(timezone.utc)
-
-            # Query to find documents where end_dtm is empty or in the future
-            query = {
-                "$or": [
-                    {"end_dtm": {"$eq": ""}},               # No end date
-                    {"end_dtm": {"$gte": current_date}}     # Future end date
-                ]
-            }
-
-            # Find the most recently created active record
-            document = collection.find_one(query, sort=[("create_dtm", DESCENDING)])
-
-            # If document found and contains 'arrears_band' data
-            if document and "arrears_band" in document:
-                arrears_band_list = document["arrears_band"]
-
-                # Merge list of dicts into one dict
-                arrears_band_dict = {k: v for d in arrears_band_list for k, v in d.items()}
-
-                logger_INC1A01.debug(f"Latest Active Arrears Band Data: {arrears_band_dict}")
-                return arrears_band_dict
-            else:
-                logger_INC1A01.info("No active arrears band data found.")
-                return {}
-
-        except Exception as e:
-            # Log query errors
-            logger_INC1A01.error(f"Unexpected error in get_arrears_bands_details: {e}")
+        # Access the 'Arrears_bands' collection through the shared pooled client
+        collection = get_db()["Arrears_bands"]
+
+        # Get the current UTC datetime
+        current_date = datetime.now(timezone.utc)
+
+        # Query to find documents where end_dtm is empty or in the future
+        query = {
+            "$or": [
+                {"end_dtm": {"$eq": ""}},               # No end date
+                {"end_dtm": {"$gte": current_date}}     # Future end date
+            ]
+        }
+
+        # Find the most recently created active record, fetching only the band data
+        document = collection.find_one(
+            query,
+            projection={"arrears_band": 1, "_id": 0},
+            sort=[("create_dtm", DESCENDING)]
+        )
+
+        # If document found and contains 'arrears_band' data
+        if document and "arrears_band" in document:
+            arrears_band_list = document["arrears_band"]
+
+            # Merge list of dicts into one dict
+            arrears_band_dict = {k: v for d in arrears_band_list for k, v in d.items()}
+
+            logger_INC1A01.debug(f"Latest Active Arrears Band Data: {arrears_band_dict}")
+            return arrears_band_dict
+        else:
+            logger_INC1A01.info("No active arrears band data found.")
             return {}
 
-    finally:
-        # Clean up MongoDB connection
-        if client:
-            client.close()
+    except Exception as e:
+        # Log query errors
+        logger_INC1A01.error(f"Unexpected error in get_arrears_bands_details: {e}")
+        return {}
 # endregion
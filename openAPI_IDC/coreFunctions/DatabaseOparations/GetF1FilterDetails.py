@@ -16,9 +16,10 @@
 """
 
 # region Imports
-from pymongo import MongoClient, errors
+from pymongo import errors
 from datetime import datetime, timezone
 from openAPI_IDC.coreFunctions.ConfigManager import get_config, initialize_hash_maps
+from openAPI_IDC.coreFunctions.DatabaseOparations.mongo_client import get_db
 from utils.customerExceptions.cust_exceptions import DatabaseConnectionError, DataNotFoundError
 from utils.logger.loggers import get_logger
 # endregion
@@ -43,81 +44,71 @@ def get_active_filters():
     filter_id_map = load_filter_id_mapping()
     filter_details = {}
 
-    client = None
     try:
-        # Fetch MongoDB connection configuration
-        db_config = get_config("database", "DATABASE")
-        client = MongoClient(db_config.get("mongo_uri").strip())
-        client.admin.command('ping')  # Check DB connectivity
-        db = client[db_config.get("db_name").strip()]
-
-    except Exception as e:
-        logger_INC1A01.error(f"Connection error: {e}")
-        return {"success": False, "error": "Mongo DB connection error"}
-
-    else:
-        try:
-            collection = db["F1_filter_config"]
-            current_date = datetime.now(timezone.utc)
-
-            # Query filters with no end_dtm or future end_dtm
-            query = {
-                "$or": [
-                    {"end_dtm": {"$eq": ""}},
-                    {"end_dtm": {"$gte": current_date}}
-                ]
+        # Access the 'F1_filter_config' collection through the shared pooled client
+        collection = get_db()["F1_filter_config"]
+        current_date = datetime.now(timezone.utc)
+
+        # Query filters with no end_dtm or future end_dtm
+        query = {
+            "$or": [
+                {"end_dtm": {"$eq": ""}},
+                {"end_dtm": {"$gte": current_date}}
+            ]
+        }
+
+        # Fetch all matching filter_documents, restricted to the fields used below
+        filter_documents = collection.find(query, {
+            "filter_id": 1,
+            "filter_rule": 1,
+            "operator": 1,
+            "rule_values": 1,
+            "source_type": 1,
+            "_id": 0
+        })
+
+        for doc in filter_documents:
+            filter_id = doc.get("filter_id")
+            new_filter_id = filter_id_map.get(filter_id)
+
+            if new_filter_id is None:
+                raise DataNotFoundError ("unknown filter_id found")
+
+            filter_rule = doc.get("filter_rule", "Unknown Rule")
+            operator = doc.get("operator", "Unknown Operator")
+            rule_values = [v.get("value") for v in doc.get("rule_values", [])]
+            source_type = [v.get("value") for v in doc.get("source_type", [])]
+
+            # Add filter details to dict
+            filter_details[filter_id] = {
+                "new_filter_id": new_filter_id,
+                "filter_rule": filter_rule,
+                "operator": operator,
+                "rule_values": rule_values,
+                "source_type": source_type,
             }
 
-            try:
-                # Fetch all matching filter_documents
-                filter_documents = collection.find(query)
-
-                for doc in filter_documents:
-                    filter_id = doc.get("filter_id")
-                    new_filter_id = filter_id_map.get(filter_id)
-
-                    if new_filter_id is None:
-                        raise DataNotFoundError ("unknown filter_id found")
+        return filter_details
 
-                    filter_rule = doc.get("filter_rule", "Unknown Rule")
-                    operator = doc.get("operator", "Unknown Operator")
-                    rule_values = [v.get("value") for v in doc.get("rule_values", [])]
-                    source_type = [v.get("value") for v in doc.get("source_type", [])]
+    except errors.ServerSelectionTimeoutError:
+        logger_INC1A01.error("Unable to connect to MongoDB server.")
+        return {}
 
-                    # Add filter details to dict
-                    filter_details[filter_id] = {
-                        "new_filter_id": new_filter_id,
-                        "filter_rule": filter_rule,
-                        "operator": operator,
-                        "rule_values": rule_values,
-                        "source_type": source_type,
-                    }
+    except errors.PyMongoError as e:
+        logger_INC1A01.error(f"MongoDB Query Error: {e}")
+        return {}
 
-                return filter_details
+    except DataNotFoundError as e:
+        logger_INC1A01.error(f"{e}")
+        return {}
 
-            except errors.PyMongoError as e:
-                logger_INC1A01.error(f"MongoDB Query Error: {e}")
-                return {}
+    except DatabaseConnectionError as database_connection_error:
+        logger_INC1A01.error(f"MongoDB Connection Error: {database_connection_error}")
+        return {}
 
-        except errors.ServerSelectionTimeoutError:
-            logger_INC1A01.error("Unable to connect to MongoDB server.")
-            return {}
-
-        except DataNotFoundError as e:
-            logger_INC1A01.error(f"{e}")
-            return {}
-
-        except DatabaseConnectionError as database_connection_error:
-            logger_INC1A01.error(f"MongoDB Connection Error: {database_connection_error}")
-            return {}
-
-        except Exception as e:
-            logger_INC1A01.error(f"Unexpected Error: {e}")
-            return {}
-
-    finally:
-        if client:
-            client.close()
+    except Exception as e:
+        logger_INC1A01.error(f"Unexpected Error: {e}")
+        return {}
 # endregion
 
 # region Load Filter ID Mapping
@@ -1,7 +1,6 @@
 # region Imports
 from pymongo import DESCENDING
-from pymongo import MongoClient
-from openAPI_IDC.coreFunctions.ConfigManager import get_config
+from openAPI_IDC.coreFunctions.DatabaseOparations.mongo_client import get_db
 from utils.logger.loggers import get_logger
 # endregion
 
@@ -15,44 +14,22 @@ def get_next_incident_id():
     Returns:
         int: The next Incident_Id.
     """
-    client = None
     try:
-        # Get database configuration from the config hash map
-        db_config = get_config("database", "DATABASE")
+        # Access the 'Incidents' collection through the shared pooled client
+        IncidentCollection = get_db()["Incidents"]
 
-        # Connect to MongoDB using configured URI
-        client = MongoClient(db_config.get("mongo_uri").strip())
+        highest_doc = IncidentCollection.find_one(
+            projection={"Incident_Id": 1, "_id": 0},
+            sort=[("Incident_Id", DESCENDING)]
+        )
 
-        # Ping to verify the connection is alive
-        client.admin.command('ping')
+        next_id = (highest_doc["Incident_Id"] + 1) if highest_doc and "Incident_Id" in highest_doc else 1
 
-        # Select the configured database
-        db = client[db_config.get("db_name").strip()]
+        logger_INC1A01.info(f"Incident_Id not provided. Found new Incident_Id: {next_id}")
 
-    except Exception as e:
-        # Log connection issues
-        logger_INC1A01.error(f"Connection error: {e}")
-        return {"success": False, "error": "Mongo DB connection error"}
-
-    else:
-        try:
-            # Access the 'Incidents' collection
-            IncidentCollection = db["Incidents"]
-
-            highest_doc = IncidentCollection.find_one(sort=[("Incident_Id", DESCENDING)])
-
-            next_id = (highest_doc["Incident_Id"] + 1) if highest_doc and "Incident_Id" in highest_doc else 1
+        return next_id
 
-            logger_INC1A01.info(f"Incident_Id not provided. Found new Incident_Id: {next_id}")
-
-            return next_id
-
-        except Exception as e:
-            # Log query errors
-            logger_INC1A01.error(f"Unexpected error in get_arrears_bands_details: {e}")
-            return -1
-
-    finally:
-        # Clean up MongoDB connection
-        if client:
-            client.close()
\ No newline at end of file
+    except Exception as e:
+        # Log query errors
+        logger_INC1A01.error(f"Unexpected error in get_next_incident_id: {e}")
+        return -1
\ No newline at end of file
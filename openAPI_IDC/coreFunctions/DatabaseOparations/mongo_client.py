@@ -0,0 +1,152 @@
+"""
+    Purpose:
+    This module provides a single shared MongoDB client for the whole application.
+
+    Description:
+    - Builds one pooled `MongoClient` the first time it is requested and reuses it
+      for every subsequent database operation, so PyMongo's connection pool is
+      shared across all requests instead of opening a fresh connection per call.
+    - Pings the server once when the client is first created to verify connectivity.
+    - Exposes `get_client()` and `get_db()` helpers for the database operation modules.
+
+    Created Date: 2025-03-23
+    Created By: Sandun Chathuranga(csandun@104@gmail.com)
+    Last Modified Date: 2025-04-21
+    Modified By: Sandun Chathuranga(csandun@104@gmail.com)
+    Version: V1
+"""
+
+# region Imports
+from functools import lru_cache
+from pymongo import MongoClient
+from openAPI_IDC.coreFunctions.ConfigManager import get_config
+from utils.logger.loggers import get_logger
+# endregion
+
+# region Logger Initialization
+logger_INC1A01 = get_logger('INC1A01')
+# endregion
+
+# region Database Config
+@lru_cache(maxsize=1)
+def _db_config():
+    """
+    Resolves and caches the (mongo_uri, db_name) pair from the config hash map,
+    so the hash-map walk and the .strip() allocations happen once per process.
+
+    Returns:
+        tuple: (mongo_uri, db_name) with surrounding whitespace stripped.
+    """
+    db_config = get_config("database", "DATABASE")
+    return db_config.get("mongo_uri").strip(), db_config.get("db_name").strip()
+# endregion
+
+# region Shared Client
+@lru_cache(maxsize=1)
+def get_client():
+    """
+    Builds the shared pooled MongoClient on first use and caches it for the
+    lifetime of the process.
+
+    Returns:
+        MongoClient: The shared client backed by PyMongo's connection pool.
+    """
+    mongo_uri, _ = _db_config()
+    client = MongoClient(
+        mongo_uri,
+        maxPoolSize=50,
+        minPoolSize=5,
+        serverSelectionTimeoutMS=3000,
+        connectTimeoutMS=5000,
+        socketTimeoutMS=10000,
+        retryWrites=True,
+        # Wire compression shrinks the BSON payloads on the read-heavy paths;
+        # the server picks the first compressor both sides support
+        compressors="zstd,snappy,zlib",
+        zlibCompressionLevel=3,
+        # Shows up in db.currentOp() and the slow-query log for profiling
+        appname="DRS-IDC"
+    )
+    client.admin.command('ping')  # Verify connectivity once at startup
+    logger_INC1A01.info("Shared MongoDB client initialized.")
+    return client
+# endregion
+
+# region Get Database
+def get_db():
+    """
+    Returns the configured application database from the shared client.
+
+    Returns:
+        Database: The MongoDB database instance configured in databaseConfig.ini.
+    """
+    _, db_name = _db_config()
+    return get_client()[db_name]
+# endregion
+
+# region Ensure Indexes
+_indexes_ensured = False
+
+def ensure_indexes():
+    """
+    Creates the indexes used by the hot query paths once per process.
+
+    The 'Case_details' collection is queried by (Account_Num, case_current_status)
+    in has_open_case_for_account and by (customer_ref, case_current_status) when
+    linking accounts, so both compound indexes are created here at startup instead
+    of on the request path.
+
+    Only a successful run is remembered, so a failed attempt (e.g. the database
+    was briefly unreachable at startup) can be retried instead of leaving the
+    hinted queries permanently broken.
+
+    Returns:
+        bool: True if all indexes were created/verified, False on failure.
+    """
+    global _indexes_ensured
+    if _indexes_ensured:
+        return True
+
+    try:
+        db = get_db()
+        db["Case_details"].create_index([("Account_Num", 1), ("case_current_status", 1)])
+        db["Case_details"].create_index([("customer_ref", 1), ("case_current_status", 1)])
+        db["Incidents"].create_index("Incident_Id", unique=True)
+        logger_INC1A01.info("MongoDB indexes ensured.")
+        _indexes_ensured = True
+        return True
+    except Exception as e:
+        logger_INC1A01.error(f"Index creation error: {e}")
+        return False
+# endregion
+
+# region Normalize Case Statuses
+def normalize_case_statuses():
+    """
+    One-off migration that lowercases every case_current_status in 'Case_details'.
+
+    The status is written with mixed casing ("Close", "close", "Case Close")
+    by the external system that owns Case_details. This migration lowercases
+    the existing data so the \$nin status filters match on fewer spellings;
+    the query-side CLOSED_STATUSES list still carries the known mixed-case
+    variants, so correctness does not depend on this having run. Run manually via:
+
+        python -m openAPI_IDC.coreFunctions.DatabaseOparations.mongo_client
+    """
+    try:
+        result = get_db()["Case_details"].update_many(
+            {}, [{"$set": {"case_current_status": {"$toLower": "$case_current_status"}}}]
+        )
+        logger_INC1A01.info(f"Normalized case_current_status on {result.modified_count} case(s).")
+        return True
+    except Exception as e:
+        logger_INC1A01.error(f"Case status normalization error: {e}")
+        return False
+# endregion
+
+
+if __name__ == '__main__':
+    from openAPI_IDC.coreFunctions.ConfigManager import initialize_hash_maps
+    initialize_hash_maps()
+    normalize_case_statuses()
+    ensure_indexes()
@@ -16,6 +16,7 @@
 """
 
 # region Imports
+import asyncio
 from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel
 from datetime import datetime
@@ -61,8 +62,8 @@ async def create_incident_endpoint(incident: Incident):
     logger_INC1A01.info(f"Received the incident data: /n {incident}")
     API_Start_time = datetime.now()
 
-    # Call the service to create the incident
-    result: IncidentServiceResponse = create_incident(incident)
+    # Run the blocking PyMongo service in a worker thread so the event loop stays free
+    result: IncidentServiceResponse = await asyncio.to_thread(create_incident, incident)
 
     # Success case
     if result.success:
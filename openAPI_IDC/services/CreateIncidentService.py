@@ -21,9 +21,10 @@
 
 # region Imports
 from datetime import datetime
+from typing import List
+from pymongo.errors import DuplicateKeyError
 from openAPI_IDC.coreFunctions.ConfigManager import initialize_hash_maps
-from openAPI_IDC.coreFunctions.DataManipulation import create_incident_data_manipulation
-from openAPI_IDC.coreFunctions.DatabaseOparations.CheckAccount import customer_link_accounts_details
+from openAPI_IDC.coreFunctions.DataManipulation import create_incident_data_manipulation, create_incidents_bulk_insert
 from openAPI_IDC.coreFunctions.DatabaseOparations.getNextIncidentID import get_next_incident_id
 from openAPI_IDC.coreFunctions.ModifyIncidentDict import get_modified_incident_dict
 from openAPI_IDC.models.CreateIncidentModel import Incident
@@ -48,6 +49,86 @@ class IncidentServiceResponse:
 # endregion
 
 
+# region Prepare Incident
+def _prepare_new_incident(incident: Incident, preassigned_id=None):
+    """
+    Builds the final incident document for insertion from the validated model.
+
+    Steps:
+    - Converts the Pydantic model to a dictionary and marks status as 'Success'.
+    - Assigns the next Incident_Id when one was not provided.
+    - Applies filtering and modification logic to the incident data.
+    - Stamps updatedAt on the document that gets inserted.
+
+    Args:
+        incident (Incident): A validated Pydantic model representing the new incident.
+        preassigned_id (int, optional): An Id already reserved by the caller
+            (used by the batch path); skips the per-item database lookup.
+
+    Returns:
+        dict: The fully prepared incident document.
+
+    Raises:
+        NotModifiedResponse: If Id generation fails or filtering rejects the incident.
+    """
+    logger_INC1A01.debug(incident)
+    # Convert the Pydantic model(CreateIncidentModel.py) to a dictionary,
+    # skipping unset None fields so they are not stored or re-walked downstream
+    incident_dict = incident.model_dump(exclude_none=True)
+
+    # Initial status set to Success
+    incident_dict["Incident_Status"] = "Success"
+
+    # Placeholder for filter reason (empty initially)
+    incident_dict["Filtered_Reason"] = ""
+
+    # Handle Incident_Id
+    if incident_dict.get("Incident_Id"):
+        # If Incident_Id is already provided in the request, log it
+        logger_INC1A01.info(f"Incident_Id provided: {incident_dict['Incident_Id']}")
+    elif preassigned_id is not None:
+        # Batch path: the caller reserved an Id block up front
+        incident_dict["Incident_Id"] = preassigned_id
+        logger_INC1A01.info(f"Preassigned Incident_Id used: {incident_dict['Incident_Id']}")
+    else:
+        # Log that no Incident_Id was provided and a new one will be generated
+        logger_INC1A01.info("Incident_Id not provided. Finding new Incident_Id for incident...")
+
+        # Call helper function to get the next available Incident_Id
+        next_id = get_next_incident_id()
+
+        # If ID generation failed (returns -1), log and raise an exception
+        if next_id < 0:
+            logger_INC1A01.error("New Incident_Id creation error")
+            raise NotModifiedResponse("New Incident_Id creation error")
+
+        # Assign the newly generated Incident_Id to the dictionary
+        incident_dict["Incident_Id"] = next_id
+
+        # Log the newly generated Incident_Id
+        logger_INC1A01.info(f"New Incident_Id assigned: {incident_dict['Incident_Id']}")
+
+    # Log the final Incident_Id that will be used (whether provided or newly generated)
+    logger_INC1A01.debug(f"Final Incident_Id being used: {incident_dict['Incident_Id']}")
+
+    logger_INC1A01.debug(incident_dict)
+
+    # Modify retrieve incident data
+    new_incident = get_modified_incident_dict(incident_dict)
+
+    logger_INC1A01.debug(new_incident)
+
+    # Stop if filtering rejected the incident
+    if new_incident.get("Incident_Status") == "Error":
+        raise NotModifiedResponse(new_incident.get("Status_Description"))
+
+    # Add/update current timestamp on the document that actually gets inserted
+    new_incident["updatedAt"] = datetime.utcnow()
+
+    return new_incident
+# endregion
+
+
 # region Main Function
 def create_incident(incident: Incident):
     """
@@ -68,59 +149,37 @@ def create_incident(incident: Incident):
         IncidentServiceResponse: Contains success flag, inserted incident ID, or an error.
     """
     try:
-        logger_INC1A01.debug(incident)
-        # Convert the Pydantic model(CreateIncidentModel.py) to a dictionary
-        incident_dict = incident.dict()
+        # An Id minted here can be re-minted on collision; a caller-provided Id
+        # must surface the duplicate to the caller instead
+        id_was_generated = not incident.Incident_Id
 
+        # Build the final incident document (Id assignment, filtering, linking)
+        new_incident = _prepare_new_incident(incident)
 
-        # Initial status set to Success
-        incident_dict["Incident_Status"] = "Success"
+        # Cross details are carried on the prepared document itself, so the
+        # insert path stays request-local under concurrent requests
+        link_accounts_details = new_incident.get("Account_Cross_Details", [])
 
-        # Placeholder for filter reason (empty initially)
-        incident_dict["Filtered_Reason"] = ""
+        # Insert and update incident, retrying in-process when our own Id collides
+        for attempt in range(3):
+            result = create_incident_data_manipulation(link_accounts_details, new_incident)
 
-        # Handle Incident_Id
-        if incident_dict.get("Incident_Id"):
-            # If Incident_Id is already provided in the request, log it
-            logger_INC1A01.info(f"Incident_Id provided: {incident_dict['Incident_Id']}")
-        else:
-            # Log that no Incident_Id was provided and a new one will be generated
-            logger_INC1A01.info("Incident_Id not provided. Finding new Incident_Id for incident...")
+            if result.get("success") or not (id_was_generated and isinstance(result.get("error"), DuplicateKeyError)):
+                break
 
-            # Call helper function to get the next available Incident_Id
             next_id = get_next_incident_id()
-
-            # If ID generation failed (returns -1), log and raise an exception
             if next_id < 0:
-                logger_INC1A01.error("New Incident_Id creation error")
-                raise NotModifiedResponse("New Incident_Id creation error")
-
-            # Assign the newly generated Incident_Id to the dictionary
-            incident_dict["Incident_Id"] = next_id
-
-            # Log the newly generated Incident_Id
-            logger_INC1A01.info(f"New Incident_Id assigned: {incident_dict['Incident_Id']}")
-
-        # Log the final Incident_Id that will be used (whether provided or newly generated)
-        logger_INC1A01.debug(f"Final Incident_Id being used: {incident_dict['Incident_Id']}")
-
-        logger_INC1A01.debug(incident_dict)
-
-        # Modify retrieve incident data
-        new_incident = get_modified_incident_dict(incident_dict)
-        #new_incident = incident_dict
-
-        logger_INC1A01.debug(new_incident)
-
-        # Stop if filtering rejected the incident
-        if new_incident.get("Incident_Status") == "Error":
-            raise NotModifiedResponse(new_incident.get("Status_Description"))
-
-        # Add/update current timestamp
-        incident_dict["updatedAt"] = datetime.now()
-
-        # Insert and update incident
-        result = create_incident_data_manipulation(customer_link_accounts_details, new_incident)
+                break
+
+            logger_INC1A01.warning(
+                "Incident_Id %s collided; retrying with %s (attempt %d)",
+                new_incident["Incident_Id"], next_id, attempt + 1
+            )
+            new_incident["Incident_Id"] = next_id
+            # The root cross-details entry carries the same Id and is both
+            # embedded in the document and written into linked records
+            if link_accounts_details:
+                link_accounts_details[0]["Incident_Id"] = next_id
 
         logger_INC1A01.debug(result)
 
@@ -141,3 +200,67 @@ def create_incident(incident: Incident):
         return IncidentServiceResponse(success=False, error=e)
 
 # endregion
+
+
+# region Bulk Function
+def create_incidents(incidents: List[Incident]):
+    """
+    Creates many incidents in one MongoDB round trip with insert_many.
+
+    Each incident is prepared individually (Id assignment, filtering, linking);
+    incidents without a caller-provided Id draw sequential Ids from a block
+    reserved once per batch. The documents that survive preparation are inserted together with an
+    unordered bulk write, so one round trip covers the whole batch instead of
+    one per incident. Unlike create_incident, this path does not propagate
+    cross-account details into previously stored incident and case documents.
+
+    Args:
+        incidents (List[Incident]): Validated Pydantic models for the new incidents.
+
+    Returns:
+        List[IncidentServiceResponse]: One response per input incident, in order.
+    """
+    responses = [None] * len(incidents)
+    prepared_docs = []
+    prepared_positions = []
+
+    # Reserve a contiguous Id block once for the whole batch; minting per item
+    # would hand every auto-Id incident the same max+1 value before any insert
+    next_free_id = None
+    if any(not incident.Incident_Id for incident in incidents):
+        next_free_id = get_next_incident_id()
+
+    for position, incident in enumerate(incidents):
+        try:
+            if incident.Incident_Id:
+                prepared = _prepare_new_incident(incident)
+            else:
+                if next_free_id is None or next_free_id < 0:
+                    logger_INC1A01.error("New Incident_Id creation error")
+                    raise NotModifiedResponse("New Incident_Id creation error")
+                prepared = _prepare_new_incident(incident, preassigned_id=next_free_id)
+                next_free_id += 1
+            prepared_docs.append(prepared)
+            prepared_positions.append(position)
+        except NotModifiedResponse as mod_err:
+            logger_INC1A01.error(f"Incident dict modification failed: {mod_err}")
+            responses[position] = IncidentServiceResponse(success=False, error=mod_err)
+        except Exception as e:
+            logger_INC1A01.error(f"Error preparing incident: {e}")
+            responses[position] = IncidentServiceResponse(success=False, error=e)
+
+    if prepared_docs:
+        result = create_incidents_bulk_insert(prepared_docs)
+        insert_errors = result.get("errors", {})
+
+        for batch_index, position in enumerate(prepared_positions):
+            error = insert_errors.get(batch_index)
+            if error is not None:
+                responses[position] = IncidentServiceResponse(success=False, error=error)
+            else:
+                responses[position] = IncidentServiceResponse(
+                    success=True, data=prepared_docs[batch_index]["Incident_Id"]
+                )
+
+    return responses
+# endregion